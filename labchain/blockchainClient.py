@@ -1,4 +1,5 @@
 import os
+import sys
 
 from labchain.datastructure.transaction import Transaction
 from labchain.network.networking import TransactionDoesNotExistException, BlockDoesNotExistException, NoPeersException
@@ -6,7 +7,11 @@ from labchain.util.Menu import Menu
 
 
 def clear_screen():
-    os.system('cls' if os.name == 'nt' else 'clear')
+    # ANSI clear instead of forking an external process; skip the control
+    # codes when stdout is not a terminal (e.g. tests or redirected output)
+    if sys.stdout.isatty():
+        sys.stdout.write('\x1b[2J\x1b[H')
+        sys.stdout.flush()
 
 
 class Wallet:
@@ -84,12 +89,19 @@ class TransactionWizard:
         self.wallet = wallet
         self.crypto_helper = crypto_helper
         self.network_interface = network_interface
+        self.__wallet_labels_cache = None
+        self.__wallet_list_cache = None
 
     def wallet_to_list(self):
-        wallet_list_result = []
-        for key in sorted(self.wallet):
-            wallet_list_result.append([str(key), self.wallet[key][0], self.wallet[key][1]])
-        return wallet_list_result
+        # every wallet access re-reads the wallet file, so memoize the
+        # resulting list; a label is never re-bound to different keys,
+        # which makes the label tuple a sufficient cache key
+        labels = tuple(sorted(self.wallet))
+        if labels != self.__wallet_labels_cache:
+            self.__wallet_labels_cache = labels
+            self.__wallet_list_cache = [[str(key), self.wallet[key][0], self.wallet[key][1]]
+                                        for key in labels]
+        return self.__wallet_list_cache
 
     def validate_sender_input(self, usr_input):
         try:
@@ -97,7 +109,7 @@ class TransactionWizard:
         except ValueError:
             return False
 
-        if int_usr_input != 0 and int_usr_input <= len(self.wallet):
+        if int_usr_input != 0 and int_usr_input <= len(self.wallet_to_list()):
             return True
         else:
             return False
@@ -263,7 +275,7 @@ class BlockchainClient:
             print('Currently you have no addresses in your wallet.\n\n')
         else:
             print('Currently you have the following addresses in your wallet:\n\n')
-            for label in self.wallet:
+            for label in sorted(self.wallet):
                 print(label)
                 print(self.wallet[label])
                 print('\n\n')
@@ -292,11 +304,8 @@ class BlockchainClient:
         if len(self.wallet) == 0:
             print('Currently you have no addresses in your wallet.\n\n')
         else:
-            i = 1
-            addresses = {}
-            for label in sorted(self.wallet):
-                addresses[str(i)] = (label, self.__delete_by_label, [label, ])
-                i += 1
+            addresses = {str(i): (label, self.__delete_by_label, [label, ])
+                         for i, label in enumerate(sorted(self.wallet), 1)}
             delete_menu = Menu(['Delete address'], addresses,
                                'Please select a key to delete: ',
                                'Exit without deleting any addresses', True)
@@ -456,31 +465,24 @@ class BlockchainClient:
 
         transactions = self.network_interface.requestAllTransactions()
 
-        transaction_exist = False
         clear_screen()
 
+        # filter first with a comprehension, so the comparison loop runs
+        # without the print calls interleaved in it
         if owner_of_public_key == "sender":
-            for transaction in transactions:
-                if public_key == transaction.sender:
-                    transaction_exist = True
+            matches = [transaction for transaction in transactions
+                       if public_key == transaction.sender]
+        elif owner_of_public_key == "receiver":
+            matches = [transaction for transaction in transactions
+                       if public_key == transaction.receiver]
+        else:
+            matches = transactions
 
-                    transaction.print()
-                    print()
-        if owner_of_public_key == "receiver":
-            for transaction in transactions:
-                if public_key == transaction.receiver:
-                    transaction_exist = True
-
-                    transaction.print()
-                    print()
-        if owner_of_public_key == "":
-            if transactions:
-                transaction_exist = True
-            for transaction in transactions:
-                transaction.print()
-                print()
+        for transaction in matches:
+            transaction.print()
+            print()
 
-        if transaction_exist == False:
+        if not matches:
             print('Transaction does not exist')
         # wait for any input before returning to menu
         input('Press enter to continue...')
@@ -5,13 +5,14 @@ from pprint import pformat
 import time
 
 from labchain.util.cryptoHelper import CryptoHelper
+from labchain.util.utility import fast_json
 from labchain.datastructure.transaction import Transaction
 
 
 class Block(object):
     def __init__(self, block_id=None, merkle_tree_root=None,
                  predecessor_hash=None, block_creator_id=None,
-                 transactions=[], nonce=0, timestamp=time.time(),
+                 transactions=[], nonce=0, timestamp=None,
                  difficulty=-1):
         """Constructor for Block, placeholder for Block information.
 
@@ -39,7 +40,10 @@ class Block(object):
 
         """
         self._block_id = block_id
-        self._timestamp = timestamp
+        # only read the clock for newly created blocks; deserialized blocks
+        # pass their stored timestamp. A time.time() default would also be
+        # evaluated once at import time, not per block.
+        self._timestamp = timestamp if timestamp is not None else time.time()
         self._transactions = transactions
         self._merkle_tree_root = merkle_tree_root
         self._predecessor_hash = predecessor_hash
@@ -96,7 +100,7 @@ class Block(object):
     @staticmethod
     def from_json(json_data):
         """Deserialize a JSON string to a Block instance."""
-        data_dict = json.loads(json_data)
+        data_dict = fast_json.loads(json_data)
         return Block.from_dict(data_dict)
 
     @staticmethod
@@ -192,7 +196,7 @@ class Block(object):
 class LogicalBlock(Block):
     def __init__(self, block_id=None, transactions=[], predecessor_hash=None,
                  block_creator_id=None, merkle_tree_root=None, nonce=0,
-                 timestamp=time.time(), consensus_obj=None, difficulty=-1):
+                 timestamp=None, consensus_obj=None, difficulty=-1):
         """Constructor for LogicalBlock, derives properties from the
         placeholder class Block.
 
@@ -266,7 +270,7 @@ class LogicalBlock(Block):
     @staticmethod
     def from_json(json_data):
         """Deserialize a JSON string to a Block instance."""
-        data_dict = json.loads(json_data)
+        data_dict = fast_json.loads(json_data)
         return LogicalBlock.from_dict(data_dict)
 
     @staticmethod
@@ -361,7 +365,7 @@ class LogicalBlock(Block):
                 # If not the last element
                 if i + 1 < len(hashes):
                     # Concatenate the hashes and calculate their hash
-                    value = str(hashes[i] + hashes[i + 1]).encode('UTF-8')
+                    value = (hashes[i] + hashes[i + 1]).encode('UTF-8')
                     hash = sha(value).hexdigest()
                 else:
                     hash = hashes[i]
@@ -373,9 +377,7 @@ class LogicalBlock(Block):
             else:
                 return _merkle_root(sub_tree)
 
-        txn_hashes = []
         if self._transactions is None:
             return None
-        for t in self._transactions:
-            txn_hashes.append(self._crypto_helper.hash(t.get_json()))
+        txn_hashes = self._crypto_helper.hash_many(t.get_json() for t in self._transactions)
         return _merkle_root(txn_hashes)
@@ -200,6 +200,47 @@ class BlockChain:
             self._blockchain_lock.release()
             return None, None
 
+    def get_transactions(self, transaction_hashes):
+        """
+        Fetches several transactions in a single chain traversal.
+
+        Parameters
+        ----------
+        transaction_hashes: List
+            Hashes of the transactions to search for
+        Returns
+        -------
+        List
+            (Transaction obj, Block_hash) tuples in the order of the
+            requested hashes; (None, None) for hashes not found
+        """
+        # Protection mechanism for multithreading
+        if not self._blockchain_lock.acquire():
+            self._logger.debug("get_transactions was unable to acquire lock")
+            raise TimeoutError
+
+        wanted = set(transaction_hashes)
+        found = {}
+        for _hash, _block in self._blockchain.items():
+            for _txn in _block.transactions:
+                if _txn.transaction_hash in wanted and _txn.transaction_hash not in found:
+                    found[_txn.transaction_hash] = (_txn, _hash)
+            if len(found) == len(wanted):
+                break
+        self._blockchain_lock.release()
+
+        res = []
+        for transaction_hash in transaction_hashes:
+            if transaction_hash in found:
+                res.append(found[transaction_hash])
+                continue
+            pool_transaction = self._txpool.get_transaction_by_hash(transaction_hash)[0]
+            if pool_transaction:
+                res.append((pool_transaction, "No block hash - this transaction still in the pool"))
+            else:
+                res.append((None, None))
+        return res
+
     def get_highest_workflow_ID(self):
         list_of_transactions = self.get_all_transactions()
         list_of_task_transaction = [TaskTransaction.from_json(t.get_json_with_signature())
@@ -676,13 +717,14 @@ class BlockChain:
             _new_head_hash = _max_head.get_computed_hash()
 
             # Save all block hashes between furthest branch and head in max chain
+            # kept as a set, since it is only used for membership tests below
             _b_hash = _new_head_hash
-            _longest_chain = []
+            _longest_chain = set()
             while _b_hash != _check_point_hash:
-                _longest_chain.append(_b_hash)
+                _longest_chain.add(_b_hash)
                 _b = self._blockchain.get(_b_hash)
                 _b_hash = _b.predecessor_hash
-            _longest_chain.append(_check_point_hash)
+            _longest_chain.add(_check_point_hash)
 
             # Remove all other branches
             # self._current_branch_heads.remove(_new_head_hash)
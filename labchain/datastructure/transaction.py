@@ -1,17 +1,22 @@
 import json
 
 from labchain.util.cryptoHelper import CryptoHelper
+from labchain.util.utility import fast_json
 
 
 class Transaction:
     """Represents a single transaction within the blockchain."""
 
+    __slots__ = ('__sender', '__receiver', '__payload', '__signature',
+                 '__transaction_hash', '__canonical_json')
+
     def __init__(self, sender, receiver, payload, signature=None):
         self.__sender = sender
         self.__receiver = receiver
         self.__payload = payload
         self.__signature = signature
         self.__transaction_hash = None
+        self.__canonical_json = None
 
     def to_dict(self):
         """Convert own data to a dictionary."""
@@ -32,24 +37,43 @@ class Transaction:
         }, sort_keys=True)
 
     def get_json(self):
-        """Serialize this instance to a JSON string."""
-        return json.dumps({
-            'sender': self.__sender,
-            'receiver': self.__receiver,
-            'payload': self.__payload
-        }, sort_keys=True)
+        """Serialize this instance to a JSON string.
+
+        The result is cached: the payload is not mutated once the
+        transaction is constructed, so signing, hashing and verification
+        all reuse the same canonical serialization.
+        """
+        if self.__canonical_json is None:
+            self.__canonical_json = json.dumps({
+                'sender': self.__sender,
+                'receiver': self.__receiver,
+                'payload': self.__payload
+            }, sort_keys=True)
+        return self.__canonical_json
 
     @staticmethod
-    def from_json(json_data):
+    def from_json(json_data, known_hash=None):
         """Deserialize a JSON string to a Transaction instance."""
-        return Transaction.from_dict(json.loads(json_data))
+        return Transaction.from_dict(fast_json.loads(json_data), known_hash)
 
     @staticmethod
-    def from_dict(data_dict):
-        """Instantiate a Transaction from a data dictionary."""
+    def from_dict(data_dict, known_hash=None):
+        """Instantiate a Transaction from a data dictionary.
+
+        Callers loading from a trusted source (own disk, already verified
+        peer data) can pass the transaction hash as known_hash to skip
+        recomputing it; untrusted callers leave it None.
+        """
         t = Transaction(data_dict['sender'], data_dict['receiver'],
                         data_dict['payload'], data_dict['signature'])
-        t.transaction_hash = CryptoHelper.instance().hash(t.get_json())
+        if known_hash is not None:
+            t.transaction_hash = known_hash
+        else:
+            t.transaction_hash = CryptoHelper.instance().hash_dict({
+                'sender': t.sender,
+                'receiver': t.receiver,
+                'payload': t.payload
+            })
         return t
 
     def sign_transaction(self, crypto_helper, private_key):
@@ -1,10 +1,13 @@
-import os
-from collections import OrderedDict
+import sys
 from labchain.util.utility import Utility
 
 
 def clear_screen():
-    os.system('cls' if os.name == 'nt' else 'clear')
+    # ANSI clear instead of forking an external process; skip the control
+    # codes when stdout is not a terminal (e.g. tests or redirected output)
+    if sys.stdout.isatty():
+        sys.stdout.write('\x1b[2J\x1b[H')
+        sys.stdout.flush()
 
 
 class Menu:
@@ -20,29 +23,26 @@ class Menu:
         :param fast_exit: Set to True to exit after the first input regardless the value.
         """
         self.prompt_text = prompt_text
-        self.menu_items = self.__to_ordered_dict(menu_items)
+        # dicts preserve insertion order (Python 3.7+) and all callers
+        # author their menu items in display order already
+        self.menu_items = dict(menu_items)
         self.__append_back_menu_item(back_option_label)
         self.input_text = input_text
         self.error_message = ''
         self.fast_exit = fast_exit
 
-    @staticmethod
-    def __to_ordered_dict(dictionary):
-        return OrderedDict(sorted(dictionary.items(), key=lambda t: t[0]))
-
     def __available_options(self):
         return ','.join(self.menu_items.keys())
 
     def __print_menu(self):
         clear_screen()
         Utility.print_labchain_logo()
-        print()
-        print()
-        for opt_index, menu_tuple in self.menu_items.items():
-            print(opt_index + ' - ' + menu_tuple[0])
-        print()
-        print()
-        print(self.error_message)
+        # write the whole menu frame in one call instead of one print per line
+        menu_frame = ('\n\n'
+                      + ''.join(opt_index + ' - ' + menu_tuple[0] + '\n'
+                                for opt_index, menu_tuple in self.menu_items.items())
+                      + '\n\n' + self.error_message + '\n')
+        sys.stdout.write(menu_frame)
 
     def __append_back_menu_item(self, back_option_label):
         self.back_option_key = 'q'
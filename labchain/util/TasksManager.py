@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict
 
 from labchain.workflow.taskTransaction import TaskTransaction
@@ -17,19 +18,20 @@ class TasksManager:
 
     @staticmethod
     def check_tasks(network_interface, public_key) -> [TaskTransaction]:
-        crypto_helper = CryptoHelper.instance()
-        received = network_interface.search_transaction_from_receiver(public_key)
-        send = network_interface.search_transaction_from_sender(public_key)
+        # the two searches are independent network requests, so run them
+        # concurrently instead of waiting for one before starting the other
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            received_future = executor.submit(network_interface.search_transaction_from_receiver, public_key)
+            send = network_interface.search_transaction_from_sender(public_key)
+            received = received_future.result()
         received_task_transaction = [TaskTransaction.from_json(t.get_json_with_signature()) for t in received if
                                      'workflow_id' in t.payload]
         send_task_transaction = [TaskTransaction.from_json(t.get_json_with_signature()) for t in send if
                                  'workflow_id' in t.payload]
-        send_task_transaction = [t for t in send_task_transaction if t.type == '2']
-        received_task_transaction_dict = {crypto_helper.hash(t.get_json()): t for t in received_task_transaction}
-        send_task_transaction_dict = {t.previous_transaction: t for t in send_task_transaction}
-        diff = {k: received_task_transaction_dict[k] for k in
-                set(received_task_transaction_dict) - set(send_task_transaction_dict)}
-        return [diff[k] for k in diff]
+        # index the answered transactions by their previous_transaction hash,
+        # so each received transaction is checked with a single set lookup
+        answered_hashes = {t.previous_transaction for t in send_task_transaction if t.type == '2'}
+        return [t for t in received_task_transaction if t.transaction_hash not in answered_hashes]
 
     @staticmethod
     def get_tasks_objects_from_task_transactions(network_interface, transactions):
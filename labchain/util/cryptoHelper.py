@@ -2,9 +2,9 @@ from Crypto.PublicKey import ECC
 from Crypto.Signature import DSS
 from Crypto.Hash import SHA256
 from base64 import b64encode, b64decode
+from functools import lru_cache
 
 from labchain.util.singleton import Singleton
-from labchain.util.utility import Utility
 
 import json
 import logging
@@ -41,9 +41,8 @@ class CryptoHelper:
         :param signature: Signature in binary string that was produced for the given data.
         :return result: True if signature and data pair matches, false otherwise."""
 
-        pub_key = b64decode(pub_key).decode()
         h = self.__hash(payload)  # Hash the payload
-        public_key = ECC.import_key(pub_key)  # Get the public key object using public key string
+        public_key = self.__import_public_key(pub_key)  # Get the public key object using public key string
         verifier = DSS.new(public_key, 'fips-186-3')  # Create a signature object
         signature = b64decode(signature.encode('utf-8'))
 
@@ -58,6 +57,11 @@ class CryptoHelper:
 
         return result
 
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def __import_public_key(pub_key):
+        return ECC.import_key(b64decode(pub_key).decode())
+
     def generate_key_pair(self):
         """
         Generates a public and private ECC key pair.
@@ -88,17 +92,40 @@ class CryptoHelper:
         hash_object = self.__hash(payload)  # Hash the payload
         return hash_object.hexdigest()  # Return hex representation of the hash
 
+    def hash_dict(self, data_dict):
+        """
+        Hashes data that is already in dictionary form, skipping the JSON
+        dump + parse round trip that hash() performs. Produces the same
+        digest as hash() applied to the sort_keys JSON dump of the dict.
+        :param data_dict: Data to be hashed as a dictionary.
+        :return hash: SHA256 hash of the given data in hex representation. """
+        message = ''.join(str(self.__canonical(data_dict[i]))
+                          for i in sorted(data_dict)).encode()
+        return SHA256.new(message).hexdigest()
+
+    @classmethod
+    def __canonical(cls, value):
+        # mirror what a json.dumps(sort_keys=True) + json.loads round trip
+        # does to container ordering, without serializing anything
+        if isinstance(value, dict):
+            return {key: cls.__canonical(value[key]) for key in sorted(value)}
+        if isinstance(value, list):
+            return [cls.__canonical(item) for item in value]
+        return value
+
+    def hash_many(self, payloads):
+        """
+        Hashes a batch of independent data items.
+        :param payloads: Iterable of data to be hashed in JSON format.
+        :return hashes: List of SHA256 hashes in hex representation, in input order. """
+        return [self.hash(payload) for payload in payloads]
+
     def __unpack_payload(self, payload):
 
-        if not Utility.is_json(payload):
+        try:
+            payload_dict = json.loads(payload)  # Get JSON string
+        except ValueError:
             raise ValueError('Payload is not json')
 
-        payload_dict = json.loads(payload)  # Get JSON string
-        sorted_payload = sorted(payload_dict)  # Get the sorted list of keys
-
-        real_payload = ""
-
-        for i in sorted_payload:
-            real_payload += str(payload_dict[i])  # Concatenate all values according to sorted keys
-
-        return real_payload
+        # Concatenate all values according to sorted keys
+        return ''.join(str(payload_dict[i]) for i in sorted(payload_dict))
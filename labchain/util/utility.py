@@ -1,6 +1,46 @@
 import json
 import re
 
+# Optional fast JSON parser used on the deserialization hot paths. Only
+# parsing is accelerated: encoding stays on the stdlib json module so the
+# canonical serialization used for hashing and signing does not change.
+try:
+    import orjson as fast_json
+except ImportError:
+    try:
+        import ujson as fast_json
+    except ImportError:
+        fast_json = json
+
+# Optional SIMD base64 decoder for the PID validation hot path; the stdlib
+# scalar decoder is the drop-in fallback.
+try:
+    from pybase64 import b64decode as fast_b64decode
+except ImportError:
+    from base64 import b64decode as fast_b64decode
+
+# functools.cached_property arrived in Python 3.8; the deployment image is
+# still python:3.7-slim, so fall back to an equivalent store-on-first-access
+# descriptor there.
+try:
+    from functools import cached_property
+except ImportError:
+    class cached_property:
+        def __init__(self, func):
+            self.func = func
+            self.attrname = None
+            self.__doc__ = func.__doc__
+
+        def __set_name__(self, owner, name):
+            self.attrname = name
+
+        def __get__(self, instance, owner=None):
+            if instance is None:
+                return self
+            value = self.func(instance)
+            instance.__dict__[self.attrname] = value
+            return value
+
 LABCHAIN_LOGO = """
           .(##%*
          ,(%########((#/.                                                                                                         ..
@@ -1,7 +1,6 @@
-import json
 import logging
-import threading
-from base64 import b64decode
+import re
+from functools import lru_cache
 from typing import Dict
 
 from Crypto.PublicKey import ECC
@@ -9,14 +8,21 @@ from Crypto.PublicKey import ECC
 import labchain.datastructure.txpool as txpool
 from labchain.datastructure.transaction import Transaction
 from labchain.util.cryptoHelper import CryptoHelper
+from labchain.util.utility import cached_property, fast_b64decode, fast_json
+
+# structural PID shape: '<base64 public key>_<task number>'
+_PID_RE = re.compile(r'[A-Za-z0-9+/=]+_\d+\Z')
 
 
 class TaskTransaction(Transaction):
-    _validation_lock = threading.Lock()
 
     def __init__(self, sender, receiver, payload: Dict, signature=None):
         super().__init__(sender, receiver, payload, signature)
         self.payload['transaction_type'] = '2'
+        # snapshot the frequently read payload fields once, so the hot
+        # validation loops read an attribute instead of a dict lookup
+        self._in_charge = self.payload.get('in_charge')
+        self._document = self.payload.get('document')
 
     def validate_transaction(self, crypto_helper, blockchain) -> bool:
         """
@@ -25,64 +31,55 @@ class TaskTransaction(Transaction):
         :param blockchain: Blockchain object
         :return result: True if transaction is valid
         """
-        TaskTransaction._validation_lock.acquire()
-        if self.payload['transaction_type'] is not '2' and self.payload['transaction_type'] is not '1':
+        # one attribute read instead of a dict lookup per payload access
+        payload = self.payload
+        if payload['transaction_type'] not in ('1', '2'):
             logging.warning('Transaction has wrong transaction type')
-            TaskTransaction._validation_lock.release()
             return False
 
-        previous_transaction: TaskTransaction = blockchain.get_transaction(self.previous_transaction)[0]
-        workflow_transaction: WorkflowTransaction = blockchain.get_transaction(self.workflow_transaction)[0]
+        sender = self.sender
+        receiver = self.receiver
+        workflow_id = payload['workflow_id']
+
+        # both lookups resolved in one chain traversal
+        previous_result, workflow_result = blockchain.get_transactions(
+            [payload['previous_transaction'], payload['workflow_transaction']])
+        previous_transaction: TaskTransaction = previous_result[0]
+        workflow_transaction: WorkflowTransaction = workflow_result[0]
 
         if previous_transaction is None:
-            TaskTransaction._validation_lock.release()
             raise ValueError(
                 'Corrupted transaction, no previous_transaction found')
 
-        if self.workflow_ID != previous_transaction.workflow_ID:
-            logging.warning('Workflow_ID of the new transaction does not match with the previous transaction.')
-            TaskTransaction._validation_lock.release()
-            return False
-
-        if self.workflow_ID != workflow_transaction.workflow_ID:
-            logging.warning('Workflow_ID of the new transaction does not match with the initial transaction.')
-            TaskTransaction._validation_lock.release()
+        if workflow_id != previous_transaction.workflow_ID \
+                or workflow_id != workflow_transaction.workflow_ID:
+            logging.warning('Workflow_ID of the new transaction does not match '
+                            'with the previous or the initial transaction.')
             return False
 
-        if not previous_transaction.receiver == self.sender:
-            logging.warning(
-                'Sender is not the receiver of the previous transaction!')
-            TaskTransaction._validation_lock.release()
+        if previous_transaction.receiver != sender \
+                or previous_transaction.in_charge_pubkey != sender:
+            logging.warning('Sender is not the receiver of the previous '
+                            'transaction or not the current owner of the document flow!')
             return False
 
-        if not previous_transaction.in_charge.split(sep='_')[0] == self.sender:
-            logging.warning(
-                'Sender is not the current owner of the document flow!')
-            TaskTransaction._validation_lock.release()
-            return False
-
-        if not self.in_charge.split(sep='_')[0] == self.receiver:
+        if not self.in_charge_pubkey == receiver:
             logging.warning('Receiver does not correspond to in_charge flag')
-            TaskTransaction._validation_lock.release()
             return False
 
         if not self._check_permissions_write(previous_transaction, workflow_transaction):
             logging.warning('Sender has not the permission to write!')
-            TaskTransaction._validation_lock.release()
             return False
 
         if not self._check_process_definition(previous_transaction, workflow_transaction):
             logging.warning(
                 'Transaction does not comply to process definition!')
-            TaskTransaction._validation_lock.release()
             return False
 
         if not self._check_for_duplicate_transactions(blockchain):
             logging.warning(
                 'Duplicated transaction found!')
-            TaskTransaction._validation_lock.release()
             return False
-        TaskTransaction._validation_lock.release()
         return self.validate_transaction_common(crypto_helper, blockchain)
 
     def validate_transaction_common(self, crypto_helper, blockchain):
@@ -93,49 +90,48 @@ class TaskTransaction(Transaction):
     def _check_permissions_write(self, previous_transaction, workflow_transaction):
         if not workflow_transaction:
             return False
-        permissions = workflow_transaction.permissions
+        permissions = workflow_transaction._permissions
+        in_charge = previous_transaction.in_charge
         for attributeName in self.document:
             if attributeName not in permissions:
                 return False
-            if previous_transaction.in_charge not in permissions[attributeName]:
+            if in_charge not in permissions[attributeName]:
                 return False
         return True
 
     def _check_process_definition(self, previous_transaction, workflow_transaction):
-        process_definition = workflow_transaction.processes
+        process_definition = workflow_transaction._processes
         if previous_transaction:
             if self.in_charge not in process_definition[previous_transaction.in_charge]:
                 return False
         return True
 
     def _check_for_duplicate_transactions(self, blockchain):
-        parallel_transactions = list(
-            set(blockchain.search_transaction_from_sender(self.sender))
-            & set(blockchain.search_transaction_to_receiver(self.receiver)))
-        parallel_transactions = [t for t in parallel_transactions if
-                                 isinstance(t, TaskTransaction) or isinstance(t, WorkflowTransaction)]
-        parallel_transactions = [t for t in parallel_transactions if t.workflow_ID == self.workflow_ID]
-        parallel_transactions = [t for t in parallel_transactions if
-                                 t.previous_transaction == self.previous_transaction]
-        return False if len(parallel_transactions) > 0 else True
-
-    def _check_pid_well_formedness(self, PID):
-        parts = PID.split(sep='_')
-
-        if not len(parts) == 2:
-            return False
-        pid_pubkey = parts[0]
-        pid_number = parts[1]
-        try:
-            i = int(pid_number)
-        except ValueError:
-            logging.warning("Number in PID wrong!")
-            logging.debug("Number in PID currently is: {}".format(parts[1]))
+        # a duplicate shares sender, receiver, workflow_ID and
+        # previous_transaction; one short-circuiting pass over the sender's
+        # transactions replaces intersecting two full-chain result sets
+        return not any(
+            t.receiver == self.receiver
+            and isinstance(t, TaskTransaction)
+            and t.workflow_ID == self.workflow_ID
+            and t.previous_transaction == self.previous_transaction
+            for t in blockchain.search_transaction_from_sender(self.sender))
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _check_pid_well_formedness(PID):
+        # PIDs repeat heavily within a workflow and are immutable strings,
+        # so the expensive b64decode + ECC.import_key runs once per PID
+        if not _PID_RE.match(PID):
+            logging.warning("PID is not of the form <public key>_<number>!")
+            logging.debug("PID currently is: {}".format(PID))
             return False
+        # the regex guarantees a single underscore
+        pid_pubkey = PID.rpartition('_')[0]
 
         decoded_key = ""
         try:
-            decoded_key = b64decode(pid_pubkey).decode('utf-8')
+            decoded_key = fast_b64decode(pid_pubkey).decode('utf-8')
             pk = ECC.import_key(decoded_key)  # Get the public key object using public key string
         except TypeError:
             logging.warning("Public Key in PID is wrong!")
@@ -155,44 +151,62 @@ class TaskTransaction(Transaction):
 
     @property
     def document(self):
-        return self.payload['document']
+        return self._document
 
     @property
     def in_charge(self):
-        return self.payload['in_charge']
+        return self._in_charge
 
-    @property
+    @cached_property
+    def in_charge_pubkey(self):
+        """Public-key part of the in_charge PID, split off once per instance."""
+        return self._in_charge.split(sep='_')[0]
+
+    # cached_property: the payload entries are immutable once constructed,
+    # and validation re-reads these fields on every sibling check
+    @cached_property
     def workflow_ID(self):
         return self.payload['workflow_id']
 
-    @property
+    @cached_property
     def previous_transaction(self):
         return self.payload['previous_transaction']
 
-    @property
+    @cached_property
     def workflow_transaction(self):
         return self.payload['workflow_transaction']
 
     @staticmethod
-    def from_json(json_data):
+    def from_json(json_data, known_hash=None):
         """Deserialize a JSON string to a Transaction instance."""
-        data_dict = json.loads(json_data)
-        return TaskTransaction.from_dict(data_dict)
+        data_dict = fast_json.loads(json_data)
+        return TaskTransaction.from_dict(data_dict, known_hash)
 
     @staticmethod
-    def from_dict(data_dict):
-        """Instantiate a Transaction from a data dictionary."""
-        type = data_dict['payload'].get('transaction_type', '0')
+    def from_dict(data_dict, known_hash=None):
+        """Instantiate a Transaction from a data dictionary.
+
+        known_hash lets trusted callers (disk replay, already verified peer
+        data) supply the transaction hash instead of recomputing it.
+        """
+        payload = data_dict['payload']
+        type = payload.get('transaction_type', '0')
         if type == '1':
-            t = WorkflowTransaction(sender=data_dict['sender'], receiver=data_dict['receiver'],
-                                    payload=data_dict['payload'], signature=data_dict['signature'])
+            transaction_class = WorkflowTransaction
         elif type == '2':
-            t = TaskTransaction(sender=data_dict['sender'], receiver=data_dict['receiver'],
-                                payload=data_dict['payload'], signature=data_dict['signature'])
+            transaction_class = TaskTransaction
+        else:
+            transaction_class = Transaction
+        t = transaction_class(sender=data_dict['sender'], receiver=data_dict['receiver'],
+                              payload=payload, signature=data_dict['signature'])
+        if known_hash is not None:
+            t.transaction_hash = known_hash
         else:
-            t = Transaction(sender=data_dict['sender'], receiver=data_dict['receiver'],
-                            payload=data_dict['payload'], signature=data_dict['signature'])
-        t.transaction_hash = CryptoHelper.instance().hash(t.get_json())
+            t.transaction_hash = CryptoHelper.instance().hash_dict({
+                'sender': t.sender,
+                'receiver': t.receiver,
+                'payload': t.payload
+            })
         return t
 
 
@@ -201,55 +215,64 @@ class WorkflowTransaction(TaskTransaction):
     def __init__(self, sender, receiver, payload: Dict, signature=None):
         super().__init__(sender, receiver, payload, signature)
         self.payload['transaction_type'] = '1'
+        # frozenset values give O(1) membership tests in the validation
+        # checks; the payload itself keeps the original lists
+        self._permissions = {k: frozenset(v)
+                             for k, v in self.payload.get('permissions', {}).items()}
+        self._processes = {k: frozenset(v)
+                           for k, v in self.payload.get('processes', {}).items()}
 
     @staticmethod
-    def from_json(json_data):
-        data_dict = json.loads(json_data)
-        return WorkflowTransaction.from_dict(data_dict)
+    def from_json(json_data, known_hash=None):
+        data_dict = fast_json.loads(json_data)
+        return WorkflowTransaction.from_dict(data_dict, known_hash)
 
     @staticmethod
-    def from_dict(data_dict):
-        return WorkflowTransaction(data_dict['sender'], data_dict['receiver'],
-                                   data_dict['payload'], data_dict['signature'])
+    def from_dict(data_dict, known_hash=None):
+        t = WorkflowTransaction(data_dict['sender'], data_dict['receiver'],
+                                data_dict['payload'], data_dict['signature'])
+        if known_hash is not None:
+            t.transaction_hash = known_hash
+        return t
 
     def validate_transaction(self, crypto_helper, blockchain):
-        TaskTransaction._validation_lock.acquire()
-        if self.payload['transaction_type'] is not '1':
+        own_payload = self.payload
+        if own_payload['transaction_type'] != '1':
             logging.warning('Transaction has wrong transaction type')
-            TaskTransaction._validation_lock.release()
             return False
 
-        # Check if workflow_id is already present
+        # Check if workflow_id is already present; the stored payloads carry
+        # everything needed, so read them directly instead of serializing
+        # every transaction to JSON and parsing it back
+        workflow_id = own_payload['workflow_id']
         list_of_transactions = blockchain.get_all_transactions()
         list_of_transactions += txpool.TxPool(None).get_workflow_transactions()
-        list_of_task_transaction = [TaskTransaction.from_json(t.get_json_with_signature())
-                                    for t in list_of_transactions if 'workflow_id' in t.payload]
-        list_of_workflow_transactions = [t for t in list_of_task_transaction if t.type == '1']
-        for workflow_tuple in list_of_workflow_transactions:
-            workflow = workflow_tuple
-            if self.payload['workflow_id'] == workflow.payload['workflow_id']:
-                TaskTransaction._validation_lock.release()
+        for transaction in list_of_transactions:
+            payload = transaction.payload
+            if isinstance(payload, dict) \
+                    and payload.get('transaction_type') == '1' \
+                    and payload.get('workflow_id') == workflow_id:
                 return False
 
-        for sender, receivers in self.processes.items():
-            if not self._check_pid_well_formedness(sender):
-                TaskTransaction._validation_lock.release()
+        # the same PID typically appears many times across processes and
+        # permissions; validate each distinct PID exactly once
+        pids = set(self.processes.keys())
+        for receivers in self.processes.values():
+            pids.update(receivers)
+        for permitted in self.permissions.values():
+            pids.update(permitted)
+        # cheap structural pass over the whole batch first: only PIDs that
+        # look like '<pubkey>_<number>' reach the cryptographic parse
+        if not all(_PID_RE.match(pid) for pid in pids):
+            return False
+        for pid in pids:
+            if not self._check_pid_well_formedness(pid):
                 return False
-            for receiver in receivers:
-                if not self._check_pid_well_formedness(receiver):
-                    TaskTransaction._validation_lock.release()
-                    return False
         document_keys = self.document.keys()
-        for attr, pids in self.permissions.items():
-            for pid in pids:
-                if not self._check_pid_well_formedness(pid):
-                    TaskTransaction._validation_lock.release()
-                    return False
+        for attr in self.permissions:
             if attr not in document_keys:
-                TaskTransaction._validation_lock.release()
                 return False
 
-        TaskTransaction._validation_lock.release()
         return super().validate_transaction_common(crypto_helper, blockchain)
 
     @property
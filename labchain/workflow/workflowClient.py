@@ -1,5 +1,7 @@
 import json
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
 from labchain.workflow.taskTransaction import TaskTransaction
@@ -8,7 +10,11 @@ from labchain.util.TransactionFactory import TransactionFactory
 
 
 def clear_screen():
-    os.system('cls' if os.name == 'nt' else 'clear')
+    # ANSI clear instead of forking an external process; skip the control
+    # codes when stdout is not a terminal (e.g. tests or redirected output)
+    if sys.stdout.isatty():
+        sys.stdout.write('\x1b[2J\x1b[H')
+        sys.stdout.flush()
 
 
 class WorkflowClient:
@@ -39,13 +45,11 @@ class WorkflowClient:
             wallet_id = self.ask_for_key(wallet_dict)
             wallet = wallet_dict[wallet_id]
             tasks = self.check_tasks(wallet[1])
-            from ast import literal_eval
             for task in tasks:
-                d = literal_eval(str(task))
-                print('Sender Address:   {}'.format(d['sender']))
-                print('Receiver Address: {}'.format(d['receiver']))
-                print('Payload:          {}'.format(d['payload']))
-                print('Signature:        {}'.format(d['signature']))
+                print('Sender Address:   {}'.format(task.sender))
+                print('Receiver Address: {}'.format(task.receiver))
+                print('Payload:          {}'.format(task.payload))
+                print('Signature:        {}'.format(task.signature))
             input('Press any key to return: ')
 
     def ask_for_key(self, wallet_dict: dict):
@@ -69,25 +73,27 @@ class WorkflowClient:
         return wallet_dict_result
 
     def check_tasks(self, public_key) -> List[TaskTransaction]:
-        received = self.network_interface.search_transaction_from_receiver(public_key)
-        send = self.network_interface.search_transaction_from_sender(public_key)
+        # the two searches are independent network requests, so run them
+        # concurrently instead of waiting for one before starting the other
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            received_future = executor.submit(self.network_interface.search_transaction_from_receiver, public_key)
+            send = self.network_interface.search_transaction_from_sender(public_key)
+            received = received_future.result()
         received_task_transaction = [TaskTransaction.from_json(t.get_json_with_signature()) for t in received if
                                      'workflow_id' in t.payload]
         send_task_transaction = [TaskTransaction.from_json(t.get_json_with_signature()) for t in send if
                                  'workflow_id' in t.payload]
-        send_task_transaction = [t for t in send_task_transaction if t.type == '2']
-        received_task_transaction_dict = {self.crypto_helper.hash(t.get_json()): t for t in received_task_transaction}
-        send_task_transaction_dict = {t.previous_transaction: t for t in send_task_transaction}
-        diff = {k: received_task_transaction_dict[k] for k in set(received_task_transaction_dict)
-                - set(send_task_transaction_dict)}
-        return [diff[k] for k in diff]
+        # index the answered transactions by their previous_transaction hash,
+        # so each received transaction is checked with a single set lookup
+        answered_hashes = {t.previous_transaction for t in send_task_transaction if t.type == '2'}
+        return [t for t in received_task_transaction if t.transaction_hash not in answered_hashes]
 
     def send_workflow_transaction(self):
         transaction = TransactionFactory.create_transcation(self.workflow_json["workflow"])
         for k, v in self.workflow_json["wallet"].items():
             if v["public_key"] == transaction.sender:
                 transaction.sign_transaction(self.crypto_helper, v["private_key"])
-        print(self.crypto_helper.hash(transaction.get_json()))
+        print(transaction.transaction_hash)
         self.network_interface.sendTransaction(transaction)
 
     def send_task_transaction(self):
@@ -100,7 +106,7 @@ class WorkflowClient:
         for k, v in self.workflow_json["wallet"].items():
             if v["public_key"] == transaction.sender:
                 transaction.sign_transaction(self.crypto_helper, v["private_key"])
-        print(self.crypto_helper.hash(transaction.get_json()))
+        print(transaction.transaction_hash)
         self.network_interface.sendTransaction(transaction)
 
     def read_workflow_json(self):
@@ -114,4 +120,4 @@ class WorkflowClient:
         else:
             transaction = input('which workflow,task1,task2,task3,invalid_task1?')
         transaction = TransactionFactory.create_transcation(self.workflow_json[transaction])
-        print(self.crypto_helper.hash(transaction.get_json()))
+        print(transaction.transaction_hash)
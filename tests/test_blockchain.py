@@ -48,6 +48,29 @@ class BlockChainComponent(unittest.TestCase):
         block_info = json.loads(self.blockchain.get_block_by_hash(self.blockchain._first_block_hash))
         self.assertEqual(block_info['nr'], 0)
 
+    def test_get_transactions(self):
+        # block1 holds txn1 and txn2; txn3 waits in the pool; txn4 is nowhere
+        self.blockchain._blockchain[123456] = self.block1
+        self.txpool._transactions.append(self.txn3)
+        try:
+            results = self.blockchain.get_transactions(
+                [self.txn2.transaction_hash, self.txn3.transaction_hash,
+                 self.txn1.transaction_hash, self.txn1.transaction_hash,
+                 self.txn4.transaction_hash])
+        finally:
+            self.txpool._transactions.remove(self.txn3)
+            del self.blockchain._blockchain[123456]
+        # results keep the order of the requested hashes
+        self.assertEqual((self.txn2, 123456), results[0])
+        self.assertEqual(
+            (self.txn3, 'No block hash - this transaction still in the pool'),
+            results[1])
+        self.assertEqual((self.txn1, 123456), results[2])
+        # a hash requested twice resolves to the same result twice
+        self.assertEqual(results[2], results[3])
+        # unknown hashes report (None, None) like get_transaction
+        self.assertEqual((None, None), results[4])
+
     def test_add_block(self):
         """
             Save granular factor before modifying and modify to 0.25
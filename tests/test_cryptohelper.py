@@ -39,6 +39,29 @@ class Tests(TestCase):
 
         self.assertNotEqual(hash_false, returned_hash)
 
+    def test_hash_dict_matches_hash_of_canonical_json(self):
+        #  hash_dict must stay digest-identical to hash() over the
+        #  sort_keys JSON dump, otherwise transaction identity forks
+        data = {
+            'sender': 'sender_key',
+            'receiver': 'receiver_key',
+            'payload': {
+                'z_last': [1, 2.5, True, False, None],
+                'a_first': {'nested_z': 'ünïcode ✓', 'nested_a': [{'b': 2, 'a': 1}]},
+                'transaction_type': '1',
+                'count': 42,
+            },
+        }
+        helper = CryptoHelper.instance()
+        self.assertEqual(helper.hash(json.dumps(data, sort_keys=True)),
+                         helper.hash_dict(data))
+
+    def test_hash_dict_matches_hash_for_string_payload(self):
+        data = {'sender': 's', 'receiver': 'r', 'payload': 'plain money payload'}
+        helper = CryptoHelper.instance()
+        self.assertEqual(helper.hash(json.dumps(data, sort_keys=True)),
+                         helper.hash_dict(data))
+
     def test_show_signature_true(self):
         helper = CryptoHelper.instance()
         private_key, public_key = helper.generate_key_pair()
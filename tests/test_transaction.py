@@ -292,6 +292,25 @@ class TaskTransactionTestCase(TaskTransactionCommon):
 
         self.assertTrue(taskTransaction._check_permissions_write(workflowTransaction, workflowTransaction))
 
+    def test_pid_well_formedness(self):
+        pr_key1, pu_key1 = self.crypto_helper_obj.generate_key_pair()
+        # accepted shape: '<base64 public key>_<task number>'
+        self.assertTrue(TaskTransaction._check_pid_well_formedness("{}_0".format(pu_key1)))
+        self.assertTrue(TaskTransaction._check_pid_well_formedness("{}_12".format(pu_key1)))
+        # structurally malformed PIDs
+        self.assertFalse(TaskTransaction._check_pid_well_formedness(pu_key1))
+        self.assertFalse(TaskTransaction._check_pid_well_formedness("{}_1_2".format(pu_key1)))
+        self.assertFalse(TaskTransaction._check_pid_well_formedness("{}__1".format(pu_key1)))
+        # signed, padded or blank task numbers are rejected
+        self.assertFalse(TaskTransaction._check_pid_well_formedness("{}_-1".format(pu_key1)))
+        self.assertFalse(TaskTransaction._check_pid_well_formedness("{}_+1".format(pu_key1)))
+        self.assertFalse(TaskTransaction._check_pid_well_formedness("{}_ 1".format(pu_key1)))
+        self.assertFalse(TaskTransaction._check_pid_well_formedness("{}_".format(pu_key1)))
+        # characters outside the base64 alphabet do not reach the decoder
+        self.assertFalse(TaskTransaction._check_pid_well_formedness("not!base64_1"))
+        # well-shaped but not an actual public key
+        self.assertFalse(TaskTransaction._check_pid_well_formedness("AAAA_1"))
+
     def test_process_definition(self):
         pr_key1, pu_key1 = self.crypto_helper_obj.generate_key_pair()
         pr_key2, pu_key2 = self.crypto_helper_obj.generate_key_pair()